@@ -8,13 +8,24 @@ which is useful for GTK/GI-based applications.
 Requirements:
     pip install PyGObject dbus-python
 
+PyGObject is only imported by StreamingAIClient, so synchronous clients
+start without loading GLib.
+
 Usage:
     python3 client.py
 """
 
+import collections
+import os
+import sys
+import time
+import warnings
+import weakref
+from typing import Iterable, Tuple
+
 import dbus
-from dbus.mainloop.glib import DBusGMainLoop
-from gi.repository import GLib
+import dbus.bus
+import dbus.lowlevel
 
 
 # D-Bus service details
@@ -22,23 +33,277 @@ SERVICE_NAME = "com.winux.AI"
 OBJECT_PATH = "/com/winux/AI"
 INTERFACE_NAME = "com.winux.AI"
 
+# Seconds a HealthCheck reply is reused before the service is asked again
+HEALTH_CACHE_TTL = 1.0
+
+# Interned chat roles, reused instead of allocating a new string per message
+_ROLES = {r: sys.intern(r) for r in ("system", "user", "assistant", "tool", "function")}
+
+# Limits on outstanding streaming requests: at most this many are tracked,
+# and entries older than STREAM_TTL seconds are swept every SWEEP_INTERVAL
+MAX_PENDING_STREAMS = 256
+STREAM_TTL = 300
+SWEEP_INTERVAL = 60
+
+# Texts at least this long (in bytes) are passed to SummarizeFd via a memfd
+FD_THRESHOLD = 4096
+
+# Cached bus connections and interface proxies, shared by all clients.
+# Keys are ("bus", bus_type) for connections and
+# (bus_type, service, path, interface) for proxies.
+_PROXY_CACHE = {}
+
+# Input signatures of the com.winux.AI methods, used when building raw
+# method-call messages for pipelined requests.
+_METHOD_SIGNATURES = {
+    "Complete": "ss",
+    "Chat": "a(ss)s",
+    "ChatStream": "a(ss)s",
+    "Summarize": "s",
+    "SummarizeFd": "h",
+    "Translate": "sss",
+    "AnalyzeCode": "ss",
+    "AnalyzeImage": "ss",
+    "Version": "",
+    "HealthCheck": "",
+}
+
+# Client methods accepted by batch(): D-Bus method name, number of D-Bus
+# arguments, and the defaults for trailing arguments that may be left out
+_BATCH_METHODS = {
+    "complete": ("Complete", 2, ("gpt-4o",)),
+    "chat": ("Chat", 2, ("gpt-4o",)),
+    "summarize": ("Summarize", 1, ()),
+    "translate": ("Translate", 3, ()),
+    "analyze_code": ("AnalyzeCode", 2, ()),
+    "analyze_image": ("AnalyzeImage", 2, ()),
+    "version": ("Version", 0, ()),
+    "health_check": ("HealthCheck", 0, ()),
+}
+
 
 class WinuxAIClient:
-    """Client for the Winux AI Service"""
+    """Client for the Winux AI Service
 
-    def __init__(self, use_system_bus=True):
+    One-shot notifications that return nothing useful should go through
+    _call_no_reply(), which does not wait for (or ask for) a reply.
+    ChatStream already returns quickly with a request ID, so it does not
+    need this path.
+
+    Text results are returned as dbus.String, which is a str subclass, so
+    they are not copied again on the way out.
+    """
+
+    # Element signature of the a(ss) message arrays taken by Chat/ChatStream
+    _CHAT_SIG = "(ss)"
+
+    __slots__ = (
+        'bus', 'proxy', 'interface', '_private',
+        '_complete', '_chat', '_summarize', '_summarize_fd', '_translate',
+        '_analyze_code', '_analyze_image', '_version', '_health_check',
+        '_chat_stream', '_health_cache',
+    )
+
+    def __init__(self, use_system_bus=True, private=False):
         """Initialize the AI client.
 
         Args:
             use_system_bus: If True, connect to system bus. If False, use session bus.
+            private: If True, open a connection owned by this client alone
+                instead of the shared one, and close it in close(). Meant for
+                one-shot CLI processes: the extra socket costs about a
+                millisecond, and no bus signals pile up on it.
         """
-        if use_system_bus:
-            self.bus = dbus.SystemBus()
+        self._private = private
+        if private:
+            self.bus = dbus.bus.BusConnection(self._bus_type(use_system_bus))
+            self.proxy = self.bus.get_object(SERVICE_NAME, OBJECT_PATH, introspect=False)
+            self.interface = dbus.Interface(self.proxy, INTERFACE_NAME)
         else:
-            self.bus = dbus.SessionBus()
+            self.bus, self.interface = self._get_interface(use_system_bus)
+            self.proxy = self.interface.proxy_object
+
+        # Bind the method callables once instead of on every attribute access
+        method = self.interface.get_dbus_method
+        self._complete = method("Complete", INTERFACE_NAME)
+        self._chat = method("Chat", INTERFACE_NAME)
+        self._summarize = method("Summarize", INTERFACE_NAME)
+        self._summarize_fd = method("SummarizeFd", INTERFACE_NAME)
+        self._translate = method("Translate", INTERFACE_NAME)
+        self._analyze_code = method("AnalyzeCode", INTERFACE_NAME)
+        self._analyze_image = method("AnalyzeImage", INTERFACE_NAME)
+        self._version = method("Version", INTERFACE_NAME)
+        self._health_check = method("HealthCheck", INTERFACE_NAME)
+        self._chat_stream = method("ChatStream", INTERFACE_NAME)
+
+        # (monotonic timestamp, result) of the last HealthCheck reply
+        self._health_cache = (float("-inf"), False)
+
+    @classmethod
+    def _to_dbus_messages(cls, messages):
+        """Convert (role, content) tuples to a typed D-Bus array of structs.
+
+        Giving the signature up front saves the marshaller from guessing the
+        type of every element, so plain str values can be passed as they are.
+        messages may be any iterable; it is consumed once, with no
+        intermediate list.
+        """
+        return dbus.Array(
+            ((_ROLES.get(role, role) if isinstance(role, str) else str(role),
+              content if isinstance(content, str) else str(content))
+             for role, content in messages),
+            signature=cls._CHAT_SIG)
+
+    def close(self):
+        """Close the bus connection if it is private to this client."""
+        if self._private:
+            self.bus.close()
+
+    @staticmethod
+    def _bus_type(use_system_bus):
+        """Return the bus type for a private connection.
+
+        libdbus resolves the type itself, honouring DBUS_SYSTEM_BUS_ADDRESS
+        and DBUS_SESSION_BUS_ADDRESS and its own build-time defaults.
+        """
+        if use_system_bus:
+            return dbus.bus.BusConnection.TYPE_SYSTEM
+        return dbus.bus.BusConnection.TYPE_SESSION
+
+    @classmethod
+    def _get_interface(cls, use_system_bus):
+        """Return the cached (bus, interface) pair for the requested bus.
+
+        Proxies are created without introspection, since every method we
+        call is declared explicitly with its interface name.
+        """
+        bus_type = "system" if use_system_bus else "session"
+
+        bus = _PROXY_CACHE.get(("bus", bus_type))
+        if bus is None:
+            bus = dbus.SystemBus() if use_system_bus else dbus.SessionBus()
+            _PROXY_CACHE[("bus", bus_type)] = bus
+
+        key = (bus_type, SERVICE_NAME, OBJECT_PATH, INTERFACE_NAME)
+        interface = _PROXY_CACHE.get(key)
+        if interface is None:
+            proxy = bus.get_object(SERVICE_NAME, OBJECT_PATH, introspect=False)
+            interface = _PROXY_CACHE.setdefault(
+                key, dbus.Interface(proxy, INTERFACE_NAME))
+
+        return bus, interface
+
+    def _pipeline(self, calls):
+        """Send several method calls before waiting for any of the replies.
+
+        The calls are independent, so their round-trips overlap instead of
+        being paid one after another.
+
+        Args:
+            calls: List of (method_name, args) tuples
+
+        Returns:
+            The return value of each call, in the same order as calls
+        """
+        pending = []
+        for method, args in calls:
+            msg = dbus.lowlevel.MethodCallMessage(
+                SERVICE_NAME, OBJECT_PATH, INTERFACE_NAME, method)
+            if args:
+                msg.append(*args, signature=_METHOD_SIGNATURES[method])
+            replies = []
+            call = self.bus.send_message_with_reply(
+                msg, replies.append, require_main_loop=False)
+            pending.append((call, replies))
+
+        results = []
+        for call, replies in pending:
+            call.block()
+            reply = replies[0]
+            if isinstance(reply, dbus.lowlevel.ErrorMessage):
+                raise dbus.exceptions.DBusException(
+                    *reply.get_args_list(), name=reply.get_error_name())
+            results.append(reply.get_args_list()[0])
+        return results
+
+    def batch(self, calls: list) -> list:
+        """Run several independent calls in one round-trip.
+
+        All requests are sent before any reply is awaited, so N calls cost
+        roughly one round-trip plus the service's own processing time.
+
+        Each entry behaves like the client method of the same name: omitted
+        trailing arguments take the method's defaults (the model), and
+        health_check returns a bool and goes through the health cache, taking
+        an optional (force,) argument.
+
+        Args:
+            calls: List of (method, args) tuples, where method is one of
+                complete, chat, summarize, translate, analyze_code,
+                analyze_image, version or health_check, and args are the
+                positional arguments that method takes
+
+        Returns:
+            The result of each call, in the same order as calls
+
+        Raises:
+            ValueError: If a method name is not one of the above
+            TypeError: If a method is given the wrong number of arguments
+        """
+        results = [None] * len(calls)
+        dbus_calls = []
+        slots = []
+        now = time.monotonic()
+        for i, (method, args) in enumerate(calls):
+            if method not in _BATCH_METHODS:
+                raise ValueError(
+                    f"unknown batch method {method!r}; expected one of "
+                    f"{', '.join(_BATCH_METHODS)}")
+            dbus_method, nargs, defaults = _BATCH_METHODS[method]
+            if method == "health_check":
+                checked_at, healthy = self._health_cache
+                if not (args and args[0]) and now - checked_at < HEALTH_CACHE_TTL:
+                    results[i] = healthy
+                    continue
+                args = ()
+            else:
+                missing = nargs - len(args)
+                if not 0 <= missing <= len(defaults):
+                    accepted = (f"{nargs - len(defaults)} to {nargs}"
+                                if defaults else str(nargs))
+                    raise TypeError(
+                        f"{method}() takes {accepted} arguments, got {len(args)}")
+                if missing:
+                    args = (*args, *defaults[len(defaults) - missing:])
+                if method == "chat":
+                    args = (self._to_dbus_messages(args[0]), *args[1:])
+            slots.append((i, method))
+            dbus_calls.append((dbus_method, args))
+
+        for (i, method), result in zip(slots, self._pipeline(dbus_calls)):
+            if method == "health_check":
+                result = bool(result)
+                self._health_cache = (time.monotonic(), result)
+            results[i] = result
+        return results
+
+    def _call_no_reply(self, method_name, *args):
+        """Call a method without waiting for its reply.
+
+        The message is flagged NO_REPLY_EXPECTED, so neither the bus daemon
+        nor the service has to track or send a reply. Intended for
+        notify-style methods (cancel, log, telemetry).
 
-        self.proxy = self.bus.get_object(SERVICE_NAME, OBJECT_PATH)
-        self.interface = dbus.Interface(self.proxy, INTERFACE_NAME)
+        Args:
+            method_name: The D-Bus method to call
+            *args: The method arguments
+        """
+        msg = dbus.lowlevel.MethodCallMessage(
+            SERVICE_NAME, OBJECT_PATH, INTERFACE_NAME, method_name)
+        if args:
+            msg.append(*args, signature=_METHOD_SIGNATURES.get(method_name))
+        msg.set_no_reply(True)
+        self.bus.send_message(msg)
 
     def complete(self, prompt: str, model: str = "gpt-4o") -> str:
         """Complete text based on a prompt.
@@ -50,21 +315,19 @@ class WinuxAIClient:
         Returns:
             The completed text
         """
-        return str(self.interface.Complete(prompt, model))
+        return self._complete(prompt, model)
 
-    def chat(self, messages: list, model: str = "gpt-4o") -> str:
+    def chat(self, messages: Iterable[Tuple[str, str]], model: str = "gpt-4o") -> str:
         """Chat with message history.
 
         Args:
-            messages: List of (role, content) tuples
+            messages: Iterable of (role, content) tuples, e.g. a list or generator
             model: The model to use
 
         Returns:
             The assistant's response
         """
-        # Convert to D-Bus array of structs
-        dbus_messages = [(str(role), str(content)) for role, content in messages]
-        return str(self.interface.Chat(dbus_messages, model))
+        return self._chat(self._to_dbus_messages(messages), model)
 
     def summarize(self, text: str) -> str:
         """Summarize text.
@@ -75,7 +338,29 @@ class WinuxAIClient:
         Returns:
             A concise summary
         """
-        return str(self.interface.Summarize(text))
+        return self._summarize(text)
+
+    def summarize_large(self, text: str) -> str:
+        """Summarize text that may be too large to send inline.
+
+        Long texts are written to a memfd whose descriptor is passed to
+        SummarizeFd, so the bus daemon never copies the text itself.
+        Short texts go through Summarize as usual.
+
+        Args:
+            text: The text to summarize
+
+        Returns:
+            A concise summary
+        """
+        data = text.encode()
+        if len(data) < FD_THRESHOLD:
+            return self.summarize(text)
+
+        with os.fdopen(os.memfd_create("winux-ai-text"), "w+b") as f:
+            f.write(data)
+            f.seek(0)
+            return self._summarize_fd(dbus.types.UnixFd(f.fileno()))
 
     def translate(self, text: str, from_lang: str, to_lang: str) -> str:
         """Translate text between languages.
@@ -88,7 +373,7 @@ class WinuxAIClient:
         Returns:
             The translated text
         """
-        return str(self.interface.Translate(text, from_lang, to_lang))
+        return self._translate(text, from_lang, to_lang)
 
     def analyze_code(self, code: str, language: str) -> str:
         """Analyze source code.
@@ -100,7 +385,7 @@ class WinuxAIClient:
         Returns:
             Code analysis
         """
-        return str(self.interface.AnalyzeCode(code, language))
+        return self._analyze_code(code, language)
 
     def analyze_image(self, image_path: str, prompt: str) -> str:
         """Analyze an image.
@@ -112,7 +397,7 @@ class WinuxAIClient:
         Returns:
             Image analysis/description
         """
-        return str(self.interface.AnalyzeImage(image_path, prompt))
+        return self._analyze_image(image_path, prompt)
 
     def version(self) -> str:
         """Get the service version.
@@ -120,73 +405,173 @@ class WinuxAIClient:
         Returns:
             Version string
         """
-        return str(self.interface.Version())
+        return self._version()
 
-    def health_check(self) -> bool:
+    def health_check(self, force: bool = False) -> bool:
         """Check if the service is healthy.
 
+        A reply received within the last HEALTH_CACHE_TTL seconds is reused,
+        so callers may check before every request without a bus round-trip.
+
+        Args:
+            force: If True, always ask the service
+
         Returns:
             True if healthy
         """
-        return bool(self.interface.HealthCheck())
+        now = time.monotonic()
+        checked_at, healthy = self._health_cache
+        if not force and now - checked_at < HEALTH_CACHE_TTL:
+            return healthy
+
+        healthy = bool(self._health_check())
+        self._health_cache = (now, healthy)
+        return healthy
+
+
+def _weak_callback(method):
+    """Wrap a bound method so that GLib and the bus do not keep its object alive.
+
+    Once the object is gone the wrapper does nothing and returns False, which
+    also removes a GLib timeout source.
+    """
+    ref = weakref.WeakMethod(method)
+
+    def callback(*args):
+        func = ref()
+        return False if func is None else func(*args)
+    return callback
+
+
+def _stop_streaming(sweep_id, match):
+    """Remove a streaming client's sweep timer and signal match rule."""
+    from gi.repository import GLib
+
+    GLib.source_remove(sweep_id)
+    match.remove()
 
 
 class StreamingAIClient(WinuxAIClient):
-    """Client with streaming support"""
+    """Client with streaming support
+
+    The sweep timer and signal receiver only hold weak references to the
+    client, so one that is never closed is still freed, and its timer and
+    match rule are removed with it.
+    """
+
+    __slots__ = ('_callbacks', '_max_pending', '_match', '_finalizer', '__weakref__')
 
     def __init__(self, use_system_bus=True):
-        super().__init__(use_system_bus)
+        # Imported here so that clients without streaming skip GI start-up
+        from dbus.mainloop.glib import DBusGMainLoop
+        from gi.repository import GLib
+
         DBusGMainLoop(set_as_default=True)
-        self._callbacks = {}
+        super().__init__(use_system_bus)
+        # Outstanding streams, oldest first; bounded so that streams which
+        # never finish (dropped signal, service crash) cannot leak
+        self._callbacks = collections.OrderedDict()
+        self._max_pending = MAX_PENDING_STREAMS
+        sweep_id = GLib.timeout_add_seconds(SWEEP_INTERVAL, _weak_callback(self._sweep))
+
+        # One match rule for all streams; chunks are routed by request ID
+        self._match = self.bus.add_signal_receiver(
+            _weak_callback(self._handle_streaming_response),
+            signal_name="StreamingResponse",
+            dbus_interface=INTERFACE_NAME,
+            bus_name=SERVICE_NAME,
+            path=OBJECT_PATH
+        )
+
+        # Runs once, from close() or when the client is garbage collected
+        self._finalizer = weakref.finalize(self, _stop_streaming, sweep_id, self._match)
 
-    def chat_stream(self, messages: list, model: str = "gpt-4o",
-                    on_chunk=None, on_done=None) -> str:
+    def close(self):
+        """Stop listening for streaming responses. Safe to call more than once."""
+        self._finalizer()
+        super().close()
+
+    def chat_stream(self, messages: Iterable[Tuple[str, str]], model: str = "gpt-4o",
+                    on_chunk=None, on_done=None, chunk_threshold: int = 1024,
+                    on_error=None) -> str:
         """Start a streaming chat.
 
+        A stream that is evicted (more than MAX_PENDING_STREAMS outstanding)
+        or times out (older than STREAM_TTL) never reaches on_done; on_error
+        is called instead, or a warning is issued if there is no on_error.
+
         Args:
-            messages: List of (role, content) tuples
+            messages: Iterable of (role, content) tuples, e.g. a list or generator
             model: The model to use
-            on_chunk: Callback for each chunk (request_id, chunk)
+            on_chunk: Callback for buffered chunks (request_id, text). Called
+                once chunk_threshold characters are pending, on a newline,
+                and at the end of the stream.
             on_done: Callback when streaming is complete (request_id, full_response)
+            chunk_threshold: Number of pending characters that triggers on_chunk
+            on_error: Callback when the stream is dropped (request_id, reason)
 
         Returns:
             The request ID
         """
-        dbus_messages = [(str(role), str(content)) for role, content in messages]
-        request_id = str(self.interface.ChatStream(dbus_messages, model))
+        request_id = str(self._chat_stream(self._to_dbus_messages(messages), model))
 
         # Store callbacks
         self._callbacks[request_id] = {
             'on_chunk': on_chunk,
             'on_done': on_done,
-            'response': ''
+            'on_error': on_error,
+            'response': [],
+            'pending': [],
+            'pending_len': 0,
+            'threshold': chunk_threshold,
+            'started_at': time.monotonic()
         }
-
-        # Connect to signal
-        self.bus.add_signal_receiver(
-            self._handle_streaming_response,
-            signal_name="StreamingResponse",
-            dbus_interface=INTERFACE_NAME,
-            bus_name=SERVICE_NAME,
-            path=OBJECT_PATH
-        )
+        if len(self._callbacks) > self._max_pending:
+            evicted, callbacks = self._callbacks.popitem(last=False)
+            self._drop(evicted, callbacks, "too many pending streams")
 
         return request_id
 
+    @staticmethod
+    def _drop(request_id, callbacks, reason):
+        """Report a stream that was given up on before it finished"""
+        if callbacks['on_error']:
+            callbacks['on_error'](request_id, reason)
+        else:
+            warnings.warn(f"Stream {request_id} dropped: {reason}")
+
+    def _sweep(self):
+        """Drop streams that have not finished within STREAM_TTL"""
+        deadline = time.monotonic() - STREAM_TTL
+        while self._callbacks:
+            request_id, callbacks = next(iter(self._callbacks.items()))
+            if callbacks['started_at'] > deadline:
+                break
+            del self._callbacks[request_id]
+            self._drop(request_id, callbacks, "timed out")
+        return True
+
     def _handle_streaming_response(self, request_id, chunk, done):
         """Handle streaming response signal"""
         if request_id not in self._callbacks:
             return
 
         callbacks = self._callbacks[request_id]
-        callbacks['response'] += chunk
+        chunk = str(chunk)
+        callbacks['response'].append(chunk)
 
+        # Coalesce tiny token chunks so on_chunk runs per line or block
         if callbacks['on_chunk']:
-            callbacks['on_chunk'](request_id, chunk)
+            callbacks['pending'].append(chunk)
+            callbacks['pending_len'] += len(chunk)
+            if done or '\n' in chunk or callbacks['pending_len'] >= callbacks['threshold']:
+                callbacks['on_chunk'](request_id, ''.join(callbacks['pending']))
+                callbacks['pending'] = []
+                callbacks['pending_len'] = 0
 
         if done:
             if callbacks['on_done']:
-                callbacks['on_done'](request_id, callbacks['response'])
+                callbacks['on_done'](request_id, ''.join(callbacks['response']))
             del self._callbacks[request_id]
 
 
@@ -196,51 +581,40 @@ def main():
 
     # Create client
     try:
-        client = WinuxAIClient(use_system_bus=True)
+        client = WinuxAIClient(use_system_bus=True, private=True)
     except dbus.exceptions.DBusException as e:
         print(f"Failed to connect to system bus: {e}")
         print("Trying session bus...")
-        client = WinuxAIClient(use_system_bus=False)
+        client = WinuxAIClient(use_system_bus=False, private=True)
+
+    # The connection is private to this process, so close it however the
+    # examples end
+    try:
+        run_examples(client)
+    finally:
+        client.close()
+
 
-    # Health check
+def run_examples(client):
+    """Run the example requests against a connected client"""
+    # Health check and version, sent together in one round-trip
     print("Checking service health...")
     try:
-        healthy = client.health_check()
+        healthy, version = client.batch([("health_check", ()), ("version", ())])
         print(f"Service healthy: {healthy}\n")
     except dbus.exceptions.DBusException as e:
         print(f"Service not available: {e}")
         return
 
-    # Get version
-    version = client.version()
     print(f"Service version: {version}\n")
 
-    # Text completion
-    print("=== Text Completion ===")
+    # Example inputs
     prompt = "Complete this sentence: The future of desktop computing is"
-    print(f"Prompt: {prompt}")
-    response = client.complete(prompt)
-    print(f"Response: {response}\n")
-
-    # Chat
-    print("=== Chat ===")
     messages = [
         ("system", "You are a helpful assistant for the Winux operating system."),
         ("user", "What makes Winux special?")
     ]
-    print(f"Messages: {messages}")
-    response = client.chat(messages)
-    print(f"Response: {response}\n")
-
-    # Translation
-    print("=== Translation ===")
     text = "Welcome to Winux!"
-    print(f"English: {text}")
-    translation = client.translate(text, "en", "es")
-    print(f"Spanish: {translation}\n")
-
-    # Summarization
-    print("=== Summarization ===")
     long_text = """
     Linux is a family of open-source Unix-like operating systems based on the
     Linux kernel, an operating system kernel first released on September 17, 1991,
@@ -251,20 +625,45 @@ def main():
     name "GNU/Linux" to emphasize the importance of GNU software, causing some
     controversy.
     """
-    print(f"Text: {long_text[:100]}...")
-    summary = client.summarize(long_text)
-    print(f"Summary: {summary}\n")
-
-    # Code analysis
-    print("=== Code Analysis ===")
     code = """
 def fibonacci(n):
     if n <= 1:
         return n
     return fibonacci(n-1) + fibonacci(n-2)
 """
+
+    # The requests are independent, so send them all before waiting
+    response, chat_response, translation, summary, analysis = client.batch([
+        ("complete", (prompt,)),
+        ("chat", (messages,)),
+        ("translate", (text, "en", "es")),
+        ("summarize", (long_text,)),
+        ("analyze_code", (code, "python")),
+    ])
+
+    # Text completion
+    print("=== Text Completion ===")
+    print(f"Prompt: {prompt}")
+    print(f"Response: {response}\n")
+
+    # Chat
+    print("=== Chat ===")
+    print(f"Messages: {messages}")
+    print(f"Response: {chat_response}\n")
+
+    # Translation
+    print("=== Translation ===")
+    print(f"English: {text}")
+    print(f"Spanish: {translation}\n")
+
+    # Summarization
+    print("=== Summarization ===")
+    print(f"Text: {long_text[:100]}...")
+    print(f"Summary: {summary}\n")
+
+    # Code analysis
+    print("=== Code Analysis ===")
     print(f"Code:\n{code}")
-    analysis = client.analyze_code(code, "python")
     print(f"Analysis: {analysis}\n")
 
     print("All examples completed successfully!")
@@ -1,5 +1,6 @@
 //! D-Bus interface implementation for com.winux.AI
 
+use std::io::Read;
 use std::sync::Arc;
 use tokio::sync::RwLock;
 use uuid::Uuid;
@@ -9,6 +10,44 @@ use crate::api::{AzureOpenAIClient, RateLimiter};
 use crate::cache::ResponseCache;
 use crate::features::{ChatFeature, CodeFeature, CompleteFeature, SummarizeFeature, TranslateFeature, VisionFeature};
 
+/// Largest input SummarizeFd accepts, matching the bus message size limit
+/// that bounds Summarize's string argument
+const MAX_FD_INPUT: u64 = 128 * 1024 * 1024;
+
+/// Read UTF-8 text of at most `limit` bytes from a caller-supplied file
+///
+/// Only regular files (memfds included) are accepted, so a pipe or device
+/// such as /dev/zero cannot block the reading thread or feed it without end.
+/// Oversized, non-regular and non-UTF-8 input is rejected as `InvalidArgs`.
+fn read_fd_input(file: std::fs::File, limit: u64) -> zbus::fdo::Result<String> {
+    let metadata = file.metadata().map_err(|e| {
+        tracing::error!("SummarizeFd fstat error: {}", e);
+        zbus::fdo::Error::IOError(e.to_string())
+    })?;
+    if !metadata.file_type().is_file() {
+        return Err(zbus::fdo::Error::InvalidArgs(
+            "text_fd must refer to a regular file or memfd".to_string(),
+        ));
+    }
+    let too_large = || zbus::fdo::Error::InvalidArgs(format!("input exceeds {} bytes", limit));
+    if metadata.len() > limit {
+        return Err(too_large());
+    }
+
+    // The file may still grow after the fstat, so bound the read too
+    let mut bytes = Vec::new();
+    file.take(limit + 1).read_to_end(&mut bytes).map_err(|e| {
+        tracing::error!("SummarizeFd read error: {}", e);
+        zbus::fdo::Error::IOError(e.to_string())
+    })?;
+    if bytes.len() as u64 > limit {
+        return Err(too_large());
+    }
+
+    String::from_utf8(bytes)
+        .map_err(|_| zbus::fdo::Error::InvalidArgs("input is not valid UTF-8".to_string()))
+}
+
 /// AI Service D-Bus interface
 pub struct AIService {
     complete: Arc<CompleteFeature>,
@@ -205,6 +244,35 @@ impl AIService {
             })
     }
 
+    /// Summarize text read from a file descriptor
+    ///
+    /// Lets clients hand over large inputs (e.g. a memfd) without sending
+    /// them through the bus as a string argument. Only regular files and
+    /// memfds holding at most `MAX_FD_INPUT` bytes of UTF-8 are accepted;
+    /// see `read_fd_input`.
+    ///
+    /// # Arguments
+    /// * `fd` - Readable file descriptor holding UTF-8 text
+    ///
+    /// # Returns
+    /// A concise summary of the text
+    async fn summarize_fd(&self, fd: zbus::zvariant::OwnedFd) -> zbus::fdo::Result<String> {
+        tracing::info!("D-Bus: SummarizeFd request received");
+
+        let file = std::fs::File::from(std::os::fd::OwnedFd::from(fd));
+        let text = tokio::task::spawn_blocking(move || read_fd_input(file, MAX_FD_INPUT))
+            .await
+            .map_err(|e| zbus::fdo::Error::Failed(e.to_string()))??;
+
+        self.summarize
+            .summarize(&text)
+            .await
+            .map_err(|e| {
+                tracing::error!("Summarize error: {}", e);
+                zbus::fdo::Error::Failed(e.to_string())
+            })
+    }
+
     /// Translate text between languages
     ///
     /// # Arguments
@@ -302,10 +370,51 @@ pub const OBJECT_PATH: &str = "/com/winux/AI";
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::io::Write;
 
     #[test]
     fn test_service_constants() {
         assert_eq!(SERVICE_NAME, "com.winux.AI");
         assert_eq!(OBJECT_PATH, "/com/winux/AI");
     }
+
+    /// Open a temporary file holding `contents`; the path is unlinked at once
+    fn temp_file(contents: &[u8]) -> std::fs::File {
+        let path = std::env::temp_dir().join(format!("winux-ai-test-{}", Uuid::new_v4()));
+        std::fs::File::create(&path)
+            .unwrap()
+            .write_all(contents)
+            .unwrap();
+        let file = std::fs::File::open(&path).unwrap();
+        std::fs::remove_file(&path).unwrap();
+        file
+    }
+
+    #[test]
+    fn test_read_fd_input_regular_file() {
+        let text = read_fd_input(temp_file(b"hello world"), 64).unwrap();
+        assert_eq!(text, "hello world");
+    }
+
+    #[test]
+    fn test_read_fd_input_rejects_oversized_input() {
+        let err = read_fd_input(temp_file(b"hello world"), 4).unwrap_err();
+        assert!(matches!(err, zbus::fdo::Error::InvalidArgs(_)));
+
+        // Exactly at the limit is still accepted
+        assert_eq!(read_fd_input(temp_file(b"hello"), 5).unwrap(), "hello");
+    }
+
+    #[test]
+    fn test_read_fd_input_rejects_non_regular_files() {
+        let dev_zero = std::fs::File::open("/dev/zero").unwrap();
+        let err = read_fd_input(dev_zero, MAX_FD_INPUT).unwrap_err();
+        assert!(matches!(err, zbus::fdo::Error::InvalidArgs(_)));
+    }
+
+    #[test]
+    fn test_read_fd_input_rejects_invalid_utf8() {
+        let err = read_fd_input(temp_file(&[0xff, 0xfe, 0xfd]), 64).unwrap_err();
+        assert!(matches!(err, zbus::fdo::Error::InvalidArgs(_)));
+    }
 }
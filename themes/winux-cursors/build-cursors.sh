@@ -7,7 +7,7 @@
 #
 # Dependencies:
 #   - xcursorgen (from x11-apps package)
-#   - python3 with Pillow (only for --generate-images)
+#   - python3 with Pillow and NumPy (only for --generate-images)
 #
 
 set -e
@@ -95,12 +95,14 @@ if [ "$GENERATE_IMAGES" = true ] || [ ! -d "$SRC_DIR/x1" ]; then
     fi
 
     if ! python3 -c "import PIL" 2>/dev/null; then
-        echo -e "${YELLOW}Installing Pillow...${NC}"
-        pip3 install --user Pillow
+        # Prefer the SIMD build of Pillow; it needs a compiler, so fall back
+        # to stock Pillow when it cannot be built
+        echo -e "${YELLOW}Installing Pillow-SIMD...${NC}"
+        pip3 install --user pillow-simd || pip3 install --user Pillow
     fi
 
     # Generate the cursor images
-    python3 "$SRC_DIR/generate-cursors.py"
+    python3 "$SRC_DIR/generate-cursors.py" --optimize
     echo -e "${GREEN}Cursor images generated.${NC}"
 fi
 
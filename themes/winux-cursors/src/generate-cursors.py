@@ -3,10 +3,30 @@
 Winux Cursor Theme Generator
 Generates modern minimalist cursor images with cyan accent color.
 Style: Similar to macOS but with unique Winux identity.
+
+Works with stock Pillow; Pillow-SIMD (same PIL import) speeds up the blur,
+composite and resize steps.
+
+Drop shadows are the most expensive step; set WINUX_CURSOR_SHADOW=0 to skip
+them while iterating on the designs:
+
+    WINUX_CURSOR_SHADOW=0 python generate-cursors.py
+
+WINUX_CURSOR_NUMBA=1 stamps the spinner dots with a Numba-compiled loop if
+Numba is installed. It is off by default: importing and compiling Numba costs
+far more than the few milliseconds the PIL path spends on the spinners.
 """
 
+import argparse
 import os
 import math
+import shutil
+import subprocess
+import functools
+import io
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 # Configuration
@@ -22,21 +42,172 @@ SIZES = {
     'x2': 64
 }
 
+# Transparent canvases per output size; copy() is a plain memcpy, cheaper
+# than Image.new filling a fresh buffer for every cursor
+_BLANK_POOL = {size: Image.new('RGBA', (size, size), (0, 0, 0, 0))
+               for size in SIZES.values()}
+
+
+def _blank(size):
+    """Return a new fully transparent size x size RGBA image."""
+    blank = _BLANK_POOL.get(size)
+    if blank is None:
+        blank = _BLANK_POOL[size] = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    return blank.copy()
+
+
+def _spinner_positions(num_dots):
+    """Unit-circle (cos, sin) offsets of the spinner dots, starting at 12 o'clock."""
+    positions = []
+    for i in range(num_dots):
+        angle = (2 * math.pi * i / num_dots) - math.pi/2
+        positions.append((math.cos(angle), math.sin(angle)))
+    return positions
+
+
+def _spinner_colors(num_dots, gray, min_alpha):
+    """RGBA of a spinner dot, indexed by its distance behind the lead dot."""
+    colors = []
+    for i in range(num_dots):
+        opacity = math.floor(255 * (1 - i / num_dots))
+
+        # Gradient from accent color to gray
+        rgb = tuple(int(c * opacity/255 + gray * (1 - opacity/255))
+                    for c in ACCENT_COLOR)
+        colors.append(rgb + (max(min_alpha, opacity),))
+    return colors
+
+
+# Spinner tables, keyed by dot count: 12 for wait, 8 for progress
+_SPINNER_POS = {n: _spinner_positions(n) for n in (12, 8)}
+_SPINNER_COLORS = {12: _spinner_colors(12, 100, 50), 8: _spinner_colors(8, 80, 80)}
+
+
+@functools.lru_cache(maxsize=32)
+def _spinner_dots(num_dots, center_x, center_y, radius):
+    """Pixel centers of the spinner dots; only the colors change per frame."""
+    return tuple((center_x + int(radius * cos_a), center_y + int(radius * sin_a))
+                 for cos_a, sin_a in _SPINNER_POS[num_dots])
+
+
+_DOT_MASKS = {}
+
+
+def _dot_mask(dot_radius):
+    """'L' mask of a filled dot, rasterized exactly like ImageDraw.ellipse."""
+    mask = _DOT_MASKS.get(dot_radius)
+    if mask is None:
+        diameter = 2 * dot_radius + 1
+        mask = _DOT_MASKS[dot_radius] = Image.new('L', (diameter, diameter), 0)
+        ImageDraw.Draw(mask).ellipse([0, 0, diameter - 1, diameter - 1], fill=255)
+    return mask
+
+
+def _spinner_kernel(buf, dots, colors, mask, frame):
+    """Per-pixel spinner stamping loop, compiled by Numba when USE_NUMBA is set.
+
+    buf is an RGBA uint8 array, dots an (n, 2) int array of centers, colors
+    an (n, 4) uint8 array and mask a boolean dot mask.
+    """
+    r = mask.shape[0] // 2
+    height, width = buf.shape[0], buf.shape[1]
+    num_dots = dots.shape[0]
+    for i in range(num_dots):
+        color = (i - frame) % num_dots
+        x, y = dots[i, 0], dots[i, 1]
+        for dy in range(-r, r + 1):
+            py = y + dy
+            if py < 0 or py >= height:
+                continue
+            for dx in range(-r, r + 1):
+                px = x + dx
+                if px < 0 or px >= width or not mask[dy + r, dx + r]:
+                    continue
+                for k in range(4):
+                    buf[py, px, k] = colors[color, k]
+
+
+@functools.lru_cache(maxsize=1)
+def _jit_spinner_kernel():
+    """Compile _spinner_kernel with Numba, or return None if it is not installed."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_spinner_kernel)
+
+
+def _stamp_spinner(img, dots, colors, dot_radius, frame):
+    """Stamp all spinner dots into img, each colored by its lag behind frame."""
+    mask = _dot_mask(dot_radius)
+    kernel = _jit_spinner_kernel() if USE_NUMBA else None
+    if kernel is not None:
+        # Numba depends on NumPy, so it is only imported on this path
+        import numpy as np
+
+        buf = np.array(img)
+        kernel(buf, np.asarray(dots, np.int64), np.asarray(colors, np.uint8),
+               np.asarray(mask) > 0, frame)
+        img.paste(Image.fromarray(buf))
+        return
+
+    # A solid-color paste through the dot mask overwrites the covered pixels,
+    # like ImageDraw.ellipse, with the clipping done by PIL
+    num_dots = len(dots)
+    for i, (x, y) in enumerate(dots):
+        img.paste(colors[(i - frame) % num_dots],
+                  (x - dot_radius, y - dot_radius), mask)
+
+
+# Default arrow in 24px design units - modern sleek design
+ARROW_SHAPE = [
+    (3, 3),      # Top point
+    (3, 19),     # Bottom left
+    (7, 15),     # Inner corner
+    (11, 20),    # Bottom right tail
+    (13, 18),    # Tail outer
+    (9, 13),     # Inner right
+    (15, 13),    # Right point
+]
+ARROW_HIGHLIGHT = [(3, 3), (3, 10)]
+
+
+def _scale_points(points, size):
+    """Scale design-unit points to integer pixel coordinates for size."""
+    s = size / 24
+    return [(int(x*s), int(y*s)) for x, y in points]
+
+
+# Drop shadows on/off; WINUX_CURSOR_SHADOW=0 skips them for quicker iteration
+ENABLE_SHADOW = os.environ.get('WINUX_CURSOR_SHADOW', '1') == '1'
+
+# Opt-in Numba kernel for the spinner dots, see the module docstring
+USE_NUMBA = os.environ.get('WINUX_CURSOR_NUMBA', '0') == '1'
+
+# Cursors smaller than this get no drop shadow; at 24px the blurred shadow
+# changes pixels by at most ~10/255 and is not visible
+SHADOW_MIN_SIZE = 32
+
 # Output directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_BASE = SCRIPT_DIR
 
+# (size name, pixel size, output directory) for every theme size
+_SIZE_ITEMS = [(name, size, os.path.join(OUTPUT_BASE, name))
+               for name, size in SIZES.items()]
+
 
 def create_shadow(image, offset=(2, 2), blur_radius=3):
     """Add a subtle drop shadow to an image."""
-    # Create shadow layer
-    shadow = Image.new('RGBA', image.size, (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow)
+    # Skip the blur when disabled or where its result would be imperceptible
+    if not ENABLE_SHADOW or blur_radius < 2 or image.size[0] < SHADOW_MIN_SIZE:
+        return image
 
     # Get alpha channel from original
-    alpha = image.split()[3]
+    alpha = image.getchannel('A')
 
-    # Create shadow from alpha
+    # Create shadow layer from alpha
+    shadow = Image.new('RGBA', image.size, (0, 0, 0, 0))
     shadow.paste((0, 0, 0, 60), mask=alpha)
 
     # Blur the shadow
@@ -62,43 +233,37 @@ def draw_rounded_polygon(draw, points, fill, outline=None, outline_width=1, radi
 
 def generate_default(size):
     """Generate default arrow cursor."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    # Copy, since progress and help cursors draw on top of the result
+    return _default_arrow(size).copy()
+
+
+def _default_with_draw(size):
+    """Return a private copy of the default arrow and a Draw bound to it."""
+    img = _default_arrow(size).copy()
+    return img, ImageDraw.Draw(img)
+
+
+@functools.lru_cache(maxsize=8)
+def _default_arrow(size):
+    """Render the default arrow with its shadow; shared, do not modify."""
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     # Scale factor
     s = size / 24
 
-    # Arrow points - modern sleek design
-    arrow_points = [
-        (int(3*s), int(3*s)),      # Top point
-        (int(3*s), int(19*s)),     # Bottom left
-        (int(7*s), int(15*s)),     # Inner corner
-        (int(11*s), int(20*s)),    # Bottom right tail
-        (int(13*s), int(18*s)),    # Tail outer
-        (int(9*s), int(13*s)),     # Inner right
-        (int(15*s), int(13*s)),    # Right point
-    ]
-
     # Draw white fill with black outline
-    draw.polygon(arrow_points, fill=WHITE, outline=BLACK)
+    draw.polygon(_scale_points(ARROW_SHAPE, size), fill=WHITE, outline=BLACK)
 
     # Add subtle accent highlight on edge
-    highlight_points = [
-        (int(3*s), int(3*s)),
-        (int(3*s), int(10*s)),
-    ]
-    draw.line(highlight_points, fill=ACCENT_COLOR, width=max(1, int(s)))
+    draw.line(_scale_points(ARROW_HIGHLIGHT, size), fill=ACCENT_COLOR,
+              width=max(1, int(s)))
 
     return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
 
 
-def generate_pointer(size):
-    """Generate hand pointer cursor for links."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    s = size / 24
-
+def _draw_pointer_hand(draw, s):
+    """Draw the pointer hand at scale s."""
     # Hand pointer - pointing finger
     # Palm
     draw.rounded_rectangle(
@@ -140,12 +305,17 @@ def generate_pointer(size):
         outline=ACCENT_COLOR_DARK
     )
 
+
+def generate_pointer(size):
+    """Generate hand pointer cursor for links."""
+    img = _render_hand('pointer', size)
+    s = size / 24
     return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
 
 
 def generate_text(size):
     """Generate I-beam text cursor."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -185,8 +355,7 @@ def generate_text(size):
 
 def generate_wait_frame(size, frame):
     """Generate a single frame of the wait spinner."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    img = _blank(size)
 
     s = size / 24
     center = size // 2
@@ -194,24 +363,9 @@ def generate_wait_frame(size, frame):
     dot_radius = max(2, int(1.5*s))
     num_dots = 12
 
-    for i in range(num_dots):
-        angle = (2 * math.pi * i / num_dots) - math.pi/2
-        x = center + int(radius * math.cos(angle))
-        y = center + int(radius * math.sin(angle))
-
-        # Calculate opacity based on position relative to current frame
-        offset = (i - frame) % num_dots
-        opacity = int(255 * (1 - offset / num_dots))
-
-        # Gradient from accent color to gray
-        r = int(ACCENT_COLOR[0] * opacity/255 + 100 * (1 - opacity/255))
-        g = int(ACCENT_COLOR[1] * opacity/255 + 100 * (1 - opacity/255))
-        b = int(ACCENT_COLOR[2] * opacity/255 + 100 * (1 - opacity/255))
-
-        draw.ellipse(
-            [x - dot_radius, y - dot_radius, x + dot_radius, y + dot_radius],
-            fill=(r, g, b, max(50, opacity))
-        )
+    # Color fades with the dot's distance behind the current frame
+    _stamp_spinner(img, _spinner_dots(num_dots, center, center, radius),
+                   _SPINNER_COLORS[num_dots], dot_radius, frame)
 
     return img
 
@@ -219,7 +373,7 @@ def generate_wait_frame(size, frame):
 def generate_progress_frame(size, frame):
     """Generate a single frame of progress cursor (arrow + spinner)."""
     # Start with default arrow
-    img = generate_default(size)
+    img = _default_arrow(size).copy()
 
     s = size / 24
 
@@ -230,32 +384,33 @@ def generate_progress_frame(size, frame):
     dot_radius = max(1, int(0.8*s))
     num_dots = 8
 
-    draw = ImageDraw.Draw(img)
+    dots = _spinner_dots(num_dots, spinner_center_x, spinner_center_y,
+                         spinner_radius)
+    _stamp_spinner(img, dots, _SPINNER_COLORS[num_dots], dot_radius, frame)
 
-    for i in range(num_dots):
-        angle = (2 * math.pi * i / num_dots) - math.pi/2
-        x = spinner_center_x + int(spinner_radius * math.cos(angle))
-        y = spinner_center_y + int(spinner_radius * math.sin(angle))
+    return img
 
-        offset = (i - frame) % num_dots
-        opacity = int(255 * (1 - offset / num_dots))
 
-        r = int(ACCENT_COLOR[0] * opacity/255 + 80 * (1 - opacity/255))
-        g = int(ACCENT_COLOR[1] * opacity/255 + 80 * (1 - opacity/255))
-        b = int(ACCENT_COLOR[2] * opacity/255 + 80 * (1 - opacity/255))
+# Font for the help cursor's "?", shipped with the theme so the glyph is the
+# same on every build host: DejaVu Sans Bold reduced to that one character
+HELP_FONT = os.path.join(SCRIPT_DIR, 'fonts', 'DejaVuSans-Bold-subset.ttf')
 
-        draw.ellipse(
-            [x - dot_radius, y - dot_radius, x + dot_radius, y + dot_radius],
-            fill=(r, g, b, max(80, opacity))
-        )
 
-    return img
+@functools.lru_cache(maxsize=8)
+def _question_mark(size):
+    """Render the help cursor's "?" once per size, cropped to its ink."""
+    s = size / 24
+    font = ImageFont.truetype(HELP_FONT, max(1, int(7*s)))
+
+    left, top, right, bottom = font.getbbox("?")
+    sprite = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).text((-left, -top), "?", fill=WHITE, font=font)
+    return sprite
 
 
 def generate_help(size):
     """Generate help cursor (arrow + question mark)."""
-    img = generate_default(size)
-    draw = ImageDraw.Draw(img)
+    img, draw = _default_with_draw(size)
 
     s = size / 24
 
@@ -272,19 +427,17 @@ def generate_help(size):
     )
 
     # Question mark
-    draw.text(
-        (qm_center_x - int(2*s), qm_center_y - int(4*s)),
-        "?",
-        fill=WHITE,
-        font=None
-    )
+    glyph = _question_mark(size)
+    img.paste(glyph,
+              (qm_center_x - glyph.width // 2, qm_center_y - glyph.height // 2),
+              glyph)
 
     return img
 
 
 def generate_crosshair(size):
     """Generate crosshair cursor."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -331,7 +484,7 @@ def generate_crosshair(size):
 
 def generate_move(size):
     """Generate move cursor (4 arrows)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -391,7 +544,7 @@ def generate_move(size):
 
 def generate_not_allowed(size):
     """Generate not-allowed cursor (circle with line)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -422,13 +575,8 @@ def generate_not_allowed(size):
     return img
 
 
-def generate_grab(size):
-    """Generate open hand grab cursor."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    s = size / 24
-
+def _draw_grab_hand(draw, s):
+    """Draw the grab hand at scale s."""
     # Palm
     draw.rounded_rectangle(
         [int(4*s), int(10*s), int(20*s), int(22*s)],
@@ -457,16 +605,16 @@ def generate_grab(size):
         outline=BLACK
     )
 
-    return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
-
-
-def generate_grabbing(size):
-    """Generate closed hand grabbing cursor."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
+def generate_grab(size):
+    """Generate open hand grab cursor."""
+    img = _render_hand('grab', size)
     s = size / 24
+    return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
+
 
+def _draw_grabbing_hand(draw, s):
+    """Draw the grabbing hand at scale s."""
     # Closed fist
     draw.rounded_rectangle(
         [int(4*s), int(8*s), int(20*s), int(20*s)],
@@ -491,12 +639,32 @@ def generate_grabbing(size):
         outline=BLACK
     )
 
+
+def generate_grabbing(size):
+    """Generate closed hand grabbing cursor."""
+    img = _render_hand('grabbing', size)
+    s = size / 24
     return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
 
 
-def generate_zoom_in(size):
-    """Generate zoom-in cursor (magnifying glass with +)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+_HAND_DRAWERS = {
+    'pointer': _draw_pointer_hand,
+    'grab': _draw_grab_hand,
+    'grabbing': _draw_grabbing_hand,
+}
+
+
+def _render_hand(kind, size):
+    """Render an unshadowed hand cursor with the drawer for kind."""
+    img = _blank(size)
+    _HAND_DRAWERS[kind](ImageDraw.Draw(img), size / 24)
+    return img
+
+
+@functools.lru_cache(maxsize=8)
+def _zoom_base(size):
+    """Render the magnifying glass with its shadow; shared, do not modify."""
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -525,74 +693,73 @@ def generate_zoom_in(size):
         width=max(3, int(2.5*s))
     )
 
-    # Plus sign in glass (accent color)
-    plus_size = int(3*s)
+    # The sign is drawn later, inside the opaque glass, so it would not
+    # change the shadow anyway
+    return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
+
+
+def _draw_zoom_sign(img, size, vertical):
+    """Draw the accent minus sign, plus its vertical bar if requested."""
+    draw = ImageDraw.Draw(img)
+
+    s = size / 24
+    glass_center_x = int(9*s)
+    glass_center_y = int(9*s)
+    sign_size = int(3*s)
     line_width = max(2, int(1.5*s))
 
     draw.line(
-        [(glass_center_x - plus_size, glass_center_y),
-         (glass_center_x + plus_size, glass_center_y)],
-        fill=ACCENT_COLOR,
-        width=line_width
-    )
-    draw.line(
-        [(glass_center_x, glass_center_y - plus_size),
-         (glass_center_x, glass_center_y + plus_size)],
+        [(glass_center_x - sign_size, glass_center_y),
+         (glass_center_x + sign_size, glass_center_y)],
         fill=ACCENT_COLOR,
         width=line_width
     )
+    if vertical:
+        draw.line(
+            [(glass_center_x, glass_center_y - sign_size),
+             (glass_center_x, glass_center_y + sign_size)],
+            fill=ACCENT_COLOR,
+            width=line_width
+        )
 
-    return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
+
+def generate_zoom_in(size):
+    """Generate zoom-in cursor (magnifying glass with +)."""
+    img = _zoom_base(size).copy()
+    _draw_zoom_sign(img, size, vertical=True)
+    return img
 
 
 def generate_zoom_out(size):
     """Generate zoom-out cursor (magnifying glass with -)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _zoom_base(size).copy()
+    _draw_zoom_sign(img, size, vertical=False)
+    return img
+
+
+def generate_col_resize(size):
+    """Generate column resize cursor (horizontal double arrow)."""
+    img = _horizontal_double_arrow(size).copy()
     draw = ImageDraw.Draw(img)
 
     s = size / 24
+    center = size // 2
 
-    # Magnifying glass
-    glass_center_x = int(9*s)
-    glass_center_y = int(9*s)
-    glass_radius = int(6*s)
-
-    # Glass circle
+    # Accent dot in center
+    dot_radius = max(1, int(1*s))
     draw.ellipse(
-        [glass_center_x - glass_radius, glass_center_y - glass_radius,
-         glass_center_x + glass_radius, glass_center_y + glass_radius],
-        fill=WHITE,
-        outline=BLACK,
-        width=max(2, int(1.5*s))
-    )
-
-    # Handle
-    handle_start_x = glass_center_x + int(glass_radius * 0.7)
-    handle_start_y = glass_center_y + int(glass_radius * 0.7)
-    draw.line(
-        [(handle_start_x, handle_start_y),
-         (int(20*s), int(20*s))],
-        fill=BLACK,
-        width=max(3, int(2.5*s))
-    )
-
-    # Minus sign in glass (accent color)
-    minus_size = int(3*s)
-    line_width = max(2, int(1.5*s))
-
-    draw.line(
-        [(glass_center_x - minus_size, glass_center_y),
-         (glass_center_x + minus_size, glass_center_y)],
-        fill=ACCENT_COLOR,
-        width=line_width
+        [center - dot_radius, center - dot_radius,
+         center + dot_radius, center + dot_radius],
+        fill=ACCENT_COLOR
     )
 
-    return create_shadow(img, (int(1*s), int(1*s)), int(2*s))
+    return img
 
 
-def generate_col_resize(size):
-    """Generate column resize cursor (horizontal double arrow)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+@functools.lru_cache(maxsize=8)
+def _horizontal_double_arrow(size):
+    """Render the plain horizontal double arrow; shared, do not modify."""
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -624,20 +791,12 @@ def generate_col_resize(size):
         (center + line_length, center + arrow_size),
     ], fill=BLACK)
 
-    # Accent dot in center
-    dot_radius = max(1, int(1*s))
-    draw.ellipse(
-        [center - dot_radius, center - dot_radius,
-         center + dot_radius, center + dot_radius],
-        fill=ACCENT_COLOR
-    )
-
     return img
 
 
 def generate_row_resize(size):
     """Generate row resize cursor (vertical double arrow)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -680,77 +839,25 @@ def generate_row_resize(size):
     return img
 
 
-def generate_resize_arrow(size, direction):
-    """Generate directional resize arrows."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    s = size / 24
-    center = size // 2
-    arrow_size = int(5*s)
-    line_width = max(2, int(2*s))
-
-    # Direction vectors
-    directions = {
-        'n': (0, -1),
-        's': (0, 1),
-        'e': (1, 0),
-        'w': (-1, 0),
-        'ne': (1, -1),
-        'nw': (-1, -1),
-        'se': (1, 1),
-        'sw': (-1, 1),
-    }
-
-    dx, dy = directions[direction]
-
-    # Normalize diagonal vectors
-    if abs(dx) == 1 and abs(dy) == 1:
-        length = int(8*s)
-    else:
-        length = int(10*s)
-
-    # Calculate endpoints
-    x1 = center - dx * length // 2
-    y1 = center - dy * length // 2
-    x2 = center + dx * length // 2
-    y2 = center + dy * length // 2
-
-    # Draw line
-    draw.line([(x1, y1), (x2, y2)], fill=BLACK, width=line_width)
-
-    # Draw arrowheads at both ends
-    for end_x, end_y, dir_mult in [(x1, y1, -1), (x2, y2, 1)]:
-        if direction in ['n', 's']:
-            points = [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - dir_mult * dy * arrow_size),
-                (end_x + arrow_size, end_y - dir_mult * dy * arrow_size),
-            ]
-        elif direction in ['e', 'w']:
-            points = [
-                (end_x, end_y),
-                (end_x - dir_mult * dx * arrow_size, end_y - arrow_size),
-                (end_x - dir_mult * dx * arrow_size, end_y + arrow_size),
-            ]
-        else:  # Diagonal
-            perp_dx, perp_dy = -dy, dx  # Perpendicular vector
-            points = [
-                (end_x, end_y),
-                (int(end_x - dir_mult * dx * arrow_size + perp_dx * arrow_size * 0.5),
-                 int(end_y - dir_mult * dy * arrow_size + perp_dy * arrow_size * 0.5)),
-                (int(end_x - dir_mult * dx * arrow_size - perp_dx * arrow_size * 0.5),
-                 int(end_y - dir_mult * dy * arrow_size - perp_dy * arrow_size * 0.5)),
-            ]
+# Counter-clockwise rotation of the horizontal double arrow per direction;
+# the arrow is symmetric, so opposite directions give the same image
+RESIZE_ANGLES = {
+    'e': 0, 'w': 180, 'n': 90, 's': 270,
+    'ne': 45, 'sw': 225, 'nw': 135, 'se': 315,
+}
 
-        draw.polygon(points, fill=BLACK)
 
-    return img
+def generate_resize_arrow(size, direction):
+    """Generate directional resize arrows."""
+    # Every direction is a rotation of the same double arrow; quarter turns
+    # are exact pixel transposes, diagonals are resampled
+    return _horizontal_double_arrow(size).rotate(
+        RESIZE_ANGLES[direction], resample=Image.BICUBIC)
 
 
 def generate_all_scroll(size):
     """Generate all-scroll cursor (4-way scroll)."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = _blank(size)
     draw = ImageDraw.Draw(img)
 
     s = size / 24
@@ -809,66 +916,194 @@ def generate_all_scroll(size):
     return img
 
 
-def main():
-    """Generate all cursor images."""
-    print("Generating Winux Cursor Theme...")
+# Generators by name, so that render tasks sent to worker processes only
+# carry plain data
+GENERATORS = {
+    'default': generate_default,
+    'pointer': generate_pointer,
+    'text': generate_text,
+    'help': generate_help,
+    'crosshair': generate_crosshair,
+    'move': generate_move,
+    'not-allowed': generate_not_allowed,
+    'grab': generate_grab,
+    'grabbing': generate_grabbing,
+    'zoom-in': generate_zoom_in,
+    'zoom-out': generate_zoom_out,
+    'col-resize': generate_col_resize,
+    'row-resize': generate_row_resize,
+    'all-scroll': generate_all_scroll,
+    'resize': generate_resize_arrow,
+    'wait': generate_wait_frame,
+    'progress': generate_progress_frame,
+}
 
-    # Create output directories
-    for size_name in SIZES.keys():
-        os.makedirs(os.path.join(OUTPUT_BASE, size_name), exist_ok=True)
+STATIC_CURSORS = [
+    'default', 'pointer', 'text', 'help', 'crosshair', 'move', 'not-allowed',
+    'grab', 'grabbing', 'zoom-in', 'zoom-out', 'col-resize', 'row-resize',
+    'all-scroll',
+]
+RESIZE_DIRECTIONS = ['n', 's', 'e', 'w', 'ne', 'nw', 'se', 'sw']
+NUM_FRAMES = 12
+
+
+def _png_chunk(tag, data):
+    """Pack one PNG chunk: length, tag, payload and CRC."""
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data)))
+
+
+def _fast_rgba_png(img):
+    """Encode an RGBA image as PNG bytes without Pillow's encoder.
+
+    Every scanline uses filter 0 (None) and the data is deflated at level 1;
+    the files are larger than Pillow's, which --optimize makes up for.
+    """
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    width, height = img.size
+    raw = img.tobytes()
+    stride = width * 4
+    scanlines = b''.join(b'\x00' + raw[y * stride:(y + 1) * stride]
+                         for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n'
+            + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(scanlines, 1))
+            + _png_chunk(b'IEND', b''))
+
+
+def _pillow_png(img):
+    """Encode an image as PNG bytes with Pillow (the --pillow-png fallback)."""
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', optimize=False, compress_level=1)
+    return buf.getvalue()
+
+
+def _render_one(task, encode=_fast_rgba_png):
+    """Render one image and encode it at each requested output size.
+
+    task is (generator_name, size, extra_args, outputs), where outputs is a
+    list of (output_size, path); outputs smaller than size are resampled.
+    encode turns each image into PNG bytes. Returns (path, data) pairs for
+    the caller to write.
+    """
+    gen_name, size, extra_args, outputs = task
+    img = GENERATORS[gen_name](size, *extra_args)
+    encoded = []
+    for output_size, output_path in outputs:
+        if output_size != size:
+            out = img.resize((output_size, output_size), Image.LANCZOS)
+        else:
+            out = img
+        # Fast, light compression; --optimize recompresses everything at the end
+        encoded.append((output_path, encode(out)))
+    return encoded
+
+
+def _write_file(path, data):
+    """Write data to path, replacing any existing file."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def build_tasks():
+    """List a render task for every PNG of the theme."""
+    def path(dirpath, cursor_name):
+        return os.path.join(dirpath, f"{cursor_name}.png")
+
+    tasks = []
 
     # Static cursors
-    static_cursors = {
-        'default': generate_default,
-        'pointer': generate_pointer,
-        'text': generate_text,
-        'help': generate_help,
-        'crosshair': generate_crosshair,
-        'move': generate_move,
-        'not-allowed': generate_not_allowed,
-        'grab': generate_grab,
-        'grabbing': generate_grabbing,
-        'zoom-in': generate_zoom_in,
-        'zoom-out': generate_zoom_out,
-        'col-resize': generate_col_resize,
-        'row-resize': generate_row_resize,
-        'all-scroll': generate_all_scroll,
-    }
-
-    # Generate static cursors
-    for cursor_name, generator in static_cursors.items():
-        print(f"  Generating {cursor_name}...")
-        for size_name, size in SIZES.items():
-            img = generator(size)
-            output_path = os.path.join(OUTPUT_BASE, size_name, f"{cursor_name}.png")
-            img.save(output_path, 'PNG')
+    for cursor_name in STATIC_CURSORS:
+        for _, size, dirpath in _SIZE_ITEMS:
+            tasks.append((cursor_name, size, (), [(size, path(dirpath, cursor_name))]))
 
     # Resize cursors
-    resize_directions = ['n', 's', 'e', 'w', 'ne', 'nw', 'se', 'sw']
-    for direction in resize_directions:
+    for direction in RESIZE_DIRECTIONS:
         cursor_name = f"{direction}-resize"
-        print(f"  Generating {cursor_name}...")
-        for size_name, size in SIZES.items():
-            img = generate_resize_arrow(size, direction)
-            output_path = os.path.join(OUTPUT_BASE, size_name, f"{cursor_name}.png")
-            img.save(output_path, 'PNG')
-
-    # Animated cursors
-    num_frames = 12
-
-    print("  Generating wait animation...")
-    for frame in range(num_frames):
-        for size_name, size in SIZES.items():
-            img = generate_wait_frame(size, frame)
-            output_path = os.path.join(OUTPUT_BASE, size_name, f"wait-{frame+1:02d}.png")
-            img.save(output_path, 'PNG')
-
-    print("  Generating progress animation...")
-    for frame in range(num_frames):
-        for size_name, size in SIZES.items():
-            img = generate_progress_frame(size, frame)
-            output_path = os.path.join(OUTPUT_BASE, size_name, f"progress-{frame+1:02d}.png")
-            img.save(output_path, 'PNG')
+        for _, size, dirpath in _SIZE_ITEMS:
+            tasks.append(('resize', size, (direction,), [(size, path(dirpath, cursor_name))]))
+
+    # The spinner is made only of filled dots, so each frame is drawn once at
+    # the largest size and resampled; outlined cursors are drawn per size to
+    # keep their 1px edges crisp
+    master_size = max(SIZES.values())
+    for frame in range(NUM_FRAMES):
+        outputs = [(size, path(dirpath, f"wait-{frame+1:02d}"))
+                   for _, size, dirpath in _SIZE_ITEMS]
+        tasks.append(('wait', master_size, (frame,), outputs))
+
+    for frame in range(NUM_FRAMES):
+        for _, size, dirpath in _SIZE_ITEMS:
+            tasks.append(('progress', size, (frame,),
+                          [(size, path(dirpath, f"progress-{frame+1:02d}"))]))
+
+    return tasks
+
+
+def optimize_pngs(paths):
+    """Recompress the generated PNGs with oxipng in a single run."""
+    if shutil.which('oxipng') is None:
+        print("  oxipng not found, leaving PNGs unoptimized")
+        return
+    print(f"  Optimizing {len(paths)} PNGs...")
+    subprocess.run(['oxipng', '-q', '-o', '4', '--strip', 'safe', *paths], check=True)
+
+
+def _render_all(tasks, render, jobs):
+    """Yield the encoded PNGs of each task, using jobs worker processes.
+
+    The whole theme renders in a few tens of milliseconds, so by default it
+    is rendered in this process, where the shape caches are shared by every
+    cursor; extra processes mostly add start-up cost.
+    """
+    if jobs == 1:
+        yield from map(render, tasks)
+        return
+
+    # Imported here: multiprocessing is slow to load and unused by default
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        yield from executor.map(render, tasks, chunksize=8)
+
+
+def main():
+    """Generate all cursor images."""
+    parser = argparse.ArgumentParser(description="Generate Winux cursor images")
+    parser.add_argument('--optimize', action='store_true',
+                        help="recompress the PNGs with oxipng after generating them")
+    parser.add_argument('--pillow-png', action='store_true',
+                        help="encode PNGs with Pillow instead of the built-in writer")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="render in N worker processes, 0 for one per CPU "
+                             "(default: 1, render in this process)")
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+
+    print("Generating Winux Cursor Theme...")
+
+    # Create output directories
+    for _, _, dirpath in _SIZE_ITEMS:
+        os.makedirs(dirpath, exist_ok=True)
+
+    tasks = build_tasks()
+    print(f"  Rendering {len(tasks)} images...")
+    # Rendering hands back encoded PNGs; a thread pool writes them while the
+    # remaining images are still being rendered
+    encode = _pillow_png if args.pillow_png else _fast_rgba_png
+    render = functools.partial(_render_one, encode=encode)
+    with ThreadPoolExecutor(max_workers=8) as writer:
+        writes = [writer.submit(_write_file, path, data)
+                  for encoded in _render_all(tasks, render, args.jobs)
+                  for path, data in encoded]
+        for write in writes:
+            write.result()
+
+    if args.optimize:
+        optimize_pngs([path for task in tasks for _, path in task[3]])
 
     print("Done! Cursor images generated in src/")
 